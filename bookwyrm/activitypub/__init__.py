@@ -2,9 +2,10 @@
 import inspect
 import sys
 
-from .base_activity import ActivityEncoder, Signature
+from .base_activity import Signature, to_json
 from .base_activity import Link, Mention
 from .base_activity import ActivitySerializerError, resolve_remote_id
+from .base_activity import resolve_remote_ids_bulk
 from .image import Image
 from .note import Note, GeneratedNote, Article, Comment, Review, Quotation
 from .note import Tombstone
@@ -12,6 +13,7 @@ from .interaction import Boost, Like
 from .ordered_collection import OrderedCollection, OrderedCollectionPage
 from .person import Person, PublicKey
 from .book import Edition, Work, Author
+from .response import ActivitypubResponse
 from .verbs import Create, Delete, Undo, Update
 from .verbs import Follow, Accept, Reject
 from .verbs import Add, AddBook, Remove
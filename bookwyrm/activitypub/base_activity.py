@@ -1,23 +1,94 @@
 ''' basics for an activitypub serializer '''
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, fields, MISSING
-from json import JSONEncoder
 
+from celery import group
 from django.apps import apps
 from django.db import transaction
+import orjson
 
 from bookwyrm.connectors import ConnectorException, get_data
 from bookwyrm.tasks import app
 
+ACTIVITYSTREAMS_CONTEXT = 'https://www.w3.org/ns/activitystreams'
+
 class ActivitySerializerError(ValueError):
     ''' routine problems serializing activitypub json '''
 
 
-class ActivityEncoder(JSONEncoder):
-    '''  used to convert an Activity object into json '''
-    def default(self, o):
-        return o.__dict__
-
+# a generated function for each activity type that sets its fields from a dict
+_FIELD_CACHE = {}
 
+def get_field_setter(cls):
+    ''' build (once per activity type) a function that copies the dataclass
+    fields from a dict onto an activity, as straight-line code with the
+    defaults filled in, instead of looping over dataclasses.fields() '''
+    try:
+        return _FIELD_CACHE[cls]
+    except KeyError:
+        pass
+
+    namespace = {
+        'MISSING': MISSING,
+        'ActivitySerializerError': ActivitySerializerError,
+    }
+    lines = [
+        'def set_fields(activity, data):',
+        '    activity_dict = activity.__dict__',
+        '    get_value = data.get',
+    ]
+    for i, field in enumerate(fields(cls)):
+        name = field.name
+        if field.default is MISSING and field.default_factory is MISSING:
+            lines += [
+                '    value = get_value(%r, MISSING)' % name,
+                '    if value is MISSING:',
+                '        raise ActivitySerializerError(',
+                '            %r)' % ('Missing required field: %s' % name),
+                '    activity_dict[%r] = value' % name,
+            ]
+        else:
+            # fields with a default_factory get MISSING, as they always have
+            namespace['default_%d' % i] = field.default
+            lines.append(
+                '    activity_dict[%r] = get_value(%r, default_%d)' % \
+                        (name, name, i))
+
+    exec('\n'.join(lines), namespace) #pylint: disable=exec-used
+    set_fields = namespace['set_fields']
+    _FIELD_CACHE[cls] = set_fields
+    return set_fields
+
+
+def set_activity_fields(activity, data):
+    ''' copy the dataclass fields from a dict onto an activity object '''
+    get_field_setter(type(activity))(activity, data)
+
+
+def to_json(activity):
+    ''' encode an activity, or a dict containing activities, as json bytes '''
+    return orjson.dumps(activity, default=lambda o: o.__dict__)
+
+
+def add_slots(cls):
+    ''' rebuild a dataclass with __slots__ for its fields, since
+    dataclass(slots=True) needs python 3.10 '''
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, '__slots__', ()))
+    field_names = [f.name for f in fields(cls)]
+
+    cls_dict = dict(cls.__dict__)
+    # the defaults live on in the generated __init__
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = tuple(n for n in field_names if n not in inherited)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@add_slots
 @dataclass
 class Link:
     ''' for tagging a book in a status '''
@@ -26,12 +97,14 @@ class Link:
     type: str = 'Link'
 
 
+@add_slots
 @dataclass
 class Mention(Link):
     ''' a subtype of Link for mentioning an actor '''
     type: str = 'Mention'
 
 
+@add_slots
 @dataclass
 class Signature:
     ''' public key block '''
@@ -51,21 +124,74 @@ class ActivityObject:
         ''' this lets you pass in an object with fields that aren't in the
         dataclass, which it ignores. Any field in the dataclass is required or
         has a default value '''
-        for field in fields(self):
-            try:
-                value = kwargs[field.name]
-            except KeyError:
-                if field.default == MISSING and \
-                        field.default_factory == MISSING:
-                    raise ActivitySerializerError(\
-                            'Missing required field: %s' % field.name)
-                value = field.default
-            setattr(self, field.name, value)
+        set_activity_fields(self, kwargs)
+
+
+    @classmethod
+    def from_dict(cls, data):
+        ''' build an activity straight from a json dict, skipping the
+        keyword argument unpacking of __init__ '''
+        activity = object.__new__(cls)
+        set_activity_fields(activity, data)
+        return activity
 
 
-    @transaction.atomic
     def to_model(self, model, instance=None, save=True):
         ''' convert from an activity to a model instance '''
+        instance = self.build_instance(model, instance=instance)
+        if not save:
+            for field in instance.image_fields:
+                field.set_field_from_activity(instance, self, save=False)
+            return instance
+
+        with transaction.atomic():
+            self.save_instance(instance)
+
+        # reversed relationships in the models
+        related_tasks = []
+        for (model_field_name, activity_field_name) in \
+                instance.deserialize_reverse_fields:
+            # attachments on Status, for example
+            values = getattr(self, activity_field_name)
+            if values is None or values is MISSING:
+                continue
+            try:
+                # this is for one to many
+                related_field = getattr(model, model_field_name).field
+            except AttributeError:
+                # it's a one to one or foreign key
+                related_field = getattr(model, model_field_name)\
+                        .related.field
+                values = [values]
+            related_model = related_field.model
+
+            # anything we already have can be linked without a task
+            known = related_model.find_existing_by_remote_ids(
+                [i for i in values if isinstance(i, str)])
+            if known:
+                # edition.parent_work = instance, for example
+                related_model.objects.filter(
+                    pk__in=[i.pk for i in known.values()]
+                ).update(**{related_field.name: instance})
+            for item in values:
+                if isinstance(item, str) and item in known:
+                    continue
+                related_tasks.append(set_related_field.s(
+                    related_model.__name__,
+                    instance.__class__.__name__,
+                    related_field.name,
+                    instance.remote_id,
+                    item
+                ))
+        if related_tasks:
+            # queue all the related fields at once
+            group(related_tasks).apply_async()
+        return instance
+
+
+    def build_instance(self, model, instance=None):
+        ''' find or create the model instance and set its simple fields,
+        without saving it '''
         if not isinstance(self, model.activity_serializer):
             raise ActivitySerializerError(
                 'Wrong activity type "%s" for model "%s" (expects "%s")' % \
@@ -79,14 +205,15 @@ class ActivityObject:
 
         for field in instance.simple_fields:
             field.set_field_from_activity(instance, self)
+        return instance
 
+
+    def save_instance(self, instance):
+        ''' write the instance and the fields that need it to be saved '''
         # image fields have to be set after other fields because they can save
         # too early and jank up users
         for field in instance.image_fields:
-            field.set_field_from_activity(instance, self, save=save)
-
-        if not save:
-            return instance
+            field.set_field_from_activity(instance, self)
 
         # we can't set many to many and reverse fields on an unsaved object
         instance.save()
@@ -96,38 +223,10 @@ class ActivityObject:
             # mention books/users, for example
             field.set_field_from_activity(instance, self)
 
-        # reversed relationships in the models
-        for (model_field_name, activity_field_name) in \
-                instance.deserialize_reverse_fields:
-            # attachments on Status, for example
-            values = getattr(self, activity_field_name)
-            if values is None or values is MISSING:
-                continue
-            try:
-                # this is for one to many
-                related_model = getattr(model, model_field_name).field.model
-            except AttributeError:
-                # it's a one to one or foreign key
-                related_model = getattr(model, model_field_name)\
-                        .related.related_model
-                values = [values]
-
-            for item in values:
-                set_related_field.delay(
-                    related_model.__name__,
-                    instance.__class__.__name__,
-                    instance.__class__.__name__.lower(),
-                    instance.remote_id,
-                    item
-                )
-        return instance
-
 
     def serialize(self):
         ''' convert to dictionary with context attr '''
-        data = self.__dict__
-        data['@context'] = 'https://www.w3.org/ns/activitystreams'
-        return data
+        return {'@context': ACTIVITYSTREAMS_CONTEXT, **self.__dict__}
 
 
 @app.task
@@ -149,7 +248,7 @@ def set_related_field(
         item = model.find_existing(data)
         if not item:
             # create a new model instance
-            item = model.activity_serializer(**data)
+            item = model.activity_serializer.from_dict(data)
             item = item.to_model(model, save=False)
     # this must exist because it's the object that triggered this function
     instance = origin_model.find_existing_by_remote_id(related_remote_id)
@@ -168,19 +267,58 @@ def resolve_remote_id(model, remote_id, refresh=False, save=True):
         return result
 
     # load the data and create the object
+    data = get_remote_data(model, remote_id)
+    return load_remote_data(
+        model, data, result=result, refresh=refresh, save=save)
+
+
+def resolve_remote_ids_bulk(model, remote_ids, save=True):
+    ''' resolve a list of remote_ids at once, looking up the known ones in a
+    single query and fetching the unknown ones from their servers in
+    parallel '''
+    remote_ids = list(dict.fromkeys(remote_ids))
+    results = model.find_existing_by_remote_ids(remote_ids)
+
+    # anything not found by remote_id might still be matched by
+    # resolve_remote_id, ie books by origin_id
+    missing = []
+    for remote_id in remote_ids:
+        if remote_id in results:
+            continue
+        result = model.find_existing_by_remote_id(remote_id)
+        if result:
+            results[remote_id] = result
+        else:
+            missing.append(remote_id)
+
+    if missing:
+        # only the http requests happen in threads, not the db work
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            all_data = executor.map(
+                lambda remote_id: get_remote_data(model, remote_id), missing)
+            for remote_id, data in zip(missing, all_data):
+                results[remote_id] = load_remote_data(model, data, save=save)
+    return [results[remote_id] for remote_id in remote_ids]
+
+
+def get_remote_data(model, remote_id):
+    ''' load the activitypub json for a remote_id '''
     try:
-        data = get_data(remote_id)
+        return get_data(remote_id)
     except (ConnectorException, ConnectionError):
         raise ActivitySerializerError(
             'Could not connect to host for remote_id in %s model: %s' % \
                 (model.__name__, remote_id))
 
+
+def load_remote_data(model, data, result=None, refresh=False, save=True):
+    ''' find or create a model instance from fetched activitypub json '''
     # check for existing items with shared unique identifiers
     if not result:
         result = model.find_existing(data)
         if result and not refresh:
             return result
 
-    item = model.activity_serializer(**data)
+    item = model.activity_serializer.from_dict(data)
     # if we're refreshing, "result" will be set and we'll update it
     return item.to_model(model, instance=result, save=save)
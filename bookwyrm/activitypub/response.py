@@ -0,0 +1,10 @@
+''' http responses for activitypub json '''
+from django.http import HttpResponse
+
+from .base_activity import to_json
+
+
+class ActivitypubResponse(HttpResponse):
+    ''' a json response for activities and collections '''
+    def __init__(self, data, content_type='application/json', **kwargs):
+        super().__init__(to_json(data), content_type=content_type, **kwargs)
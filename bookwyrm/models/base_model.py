@@ -14,7 +14,8 @@ from django.dispatch import receiver
 
 from bookwyrm import activitypub
 from bookwyrm.settings import DOMAIN, PAGE_LENGTH
-from .fields import ImageField, ManyToManyField, RemoteIdField
+from .fields import ActivitypubFieldMixin, ImageField, ManyToManyField
+from .fields import RemoteIdField
 
 
 class BookWyrmModel(models.Model):
@@ -56,6 +57,52 @@ def unfurl_related_field(related_field):
     return related_field.remote_id
 
 
+# activitypub fields for each model class, sorted by how they're deserialized
+_TO_MODEL_PLAN = {}
+
+def get_activitypub_fields(model):
+    ''' image, many to many, and "simple" activitypub fields on a model,
+    worked out once per model class rather than once per instance '''
+    try:
+        return _TO_MODEL_PLAN[model]
+    except KeyError:
+        pass
+
+    image_fields = []
+    many_to_many_fields = []
+    simple_fields = []
+    for field in model._meta.get_fields():
+        if not isinstance(field, ActivitypubFieldMixin):
+            continue
+
+        if isinstance(field, ImageField):
+            image_fields.append(field)
+        elif isinstance(field, ManyToManyField):
+            many_to_many_fields.append(field)
+        else:
+            simple_fields.append(field)
+
+    plan = (tuple(image_fields), tuple(many_to_many_fields), \
+            tuple(simple_fields))
+    _TO_MODEL_PLAN[model] = plan
+    return plan
+
+
+# fields that can be used to match incoming activities to existing objects
+_DEDUPLICATION_FIELDS = {}
+
+def get_deduplication_fields(model):
+    ''' deduplication fields on a model, found once per model class '''
+    try:
+        return _DEDUPLICATION_FIELDS[model]
+    except KeyError:
+        pass
+    dedup_fields = tuple(f for f in model._meta.get_fields() if \
+            getattr(f, 'deduplication_field', False))
+    _DEDUPLICATION_FIELDS[model] = dedup_fields
+    return dedup_fields
+
+
 class ActivitypubMixin:
     ''' add this mixin for models that are AP serializable '''
     activity_serializer = lambda: {}
@@ -63,19 +110,8 @@ class ActivitypubMixin:
 
     def __init__(self, *args, **kwargs):
         ''' collect some info on model fields '''
-        self.image_fields = []
-        self.many_to_many_fields = []
-        self.simple_fields = [] # "simple"
-        for field in self._meta.get_fields():
-            if not hasattr(field, 'field_to_activity'):
-                continue
-
-            if isinstance(field, ImageField):
-                self.image_fields.append(field)
-            elif isinstance(field, ManyToManyField):
-                self.many_to_many_fields.append(field)
-            else:
-                self.simple_fields.append(field)
+        self.image_fields, self.many_to_many_fields, self.simple_fields = \
+                get_activitypub_fields(self.__class__)
 
         self.activity_fields = self.image_fields + \
                 self.many_to_many_fields + self.simple_fields
@@ -93,17 +129,25 @@ class ActivitypubMixin:
         ''' look up a remote id in the db '''
         return cls.find_existing({'id': remote_id})
 
+    @classmethod
+    def find_existing_by_remote_ids(cls, remote_ids):
+        ''' look up a list of remote ids in the db with one query, returning
+        a dict of the objects that were found, keyed by remote id '''
+        if not remote_ids:
+            return {}
+        objects = cls.objects
+        if hasattr(objects, 'select_subclasses'):
+            objects = objects.select_subclasses()
+        return {i.remote_id: i for i in \
+                objects.filter(remote_id__in=remote_ids)}
+
     @classmethod
     def find_existing(cls, data):
         ''' compare data to fields that can be used for deduplation.
         This always includes remote_id, but can also be unique identifiers
         like an isbn for an edition '''
         filters = []
-        for field in cls._meta.get_fields():
-            if not hasattr(field, 'deduplication_field') or \
-                    not field.deduplication_field:
-                continue
-
+        for field in get_deduplication_fields(cls):
             value = data.get(field.activitypub_field)
             if not value:
                 continue
@@ -181,7 +225,7 @@ class ActivitypubMixin:
         return activitypub.Delete(
             id=self.remote_id + '/activity',
             actor=user.remote_id,
-            to=['%s/followers' % user.remote_id],
+            to=[user.followers_url],
             cc=['https://www.w3.org/ns/activitystreams#Public'],
             object=self.to_activity(),
         ).serialize()
@@ -40,9 +40,16 @@ class ActivitypubFieldMixin:
         super().__init__(*args, **kwargs)
 
 
+    def set_attributes_from_name(self, name):
+        ''' work out the activitypub field name once, when the model field is
+        named, rather than every time an activity is (de)serialized '''
+        super().set_attributes_from_name(name)
+        self.activitypub_name = self.get_activitypub_field()
+
+
     def set_field_from_activity(self, instance, data):
         ''' helper function for assinging a value to the field '''
-        value = getattr(data, self.get_activitypub_field())
+        value = getattr(data, self.activitypub_name)
         formatted = self.field_from_activity(value)
         if formatted is None or formatted is MISSING:
             return
@@ -56,7 +63,7 @@ class ActivitypubFieldMixin:
         if formatted is None:
             return
 
-        key = self.get_activitypub_field()
+        key = self.activitypub_name
         if isinstance(activity.get(key), list):
             activity[key] += formatted
         else:
@@ -94,7 +101,8 @@ class ActivitypubRelatedFieldMixin(ActivitypubFieldMixin):
         if isinstance(value, dict) and value.get('id'):
             # this is an activitypub object, which we can deserialize
             activity_serializer = related_model.activity_serializer
-            return activity_serializer(**value).to_model(related_model)
+            return activity_serializer.from_dict(value).to_model(
+                related_model)
         try:
             # make sure the value looks like a remote id
             validate_remote_id(value)
@@ -176,22 +184,26 @@ class PrivacyField(ActivitypubFieldMixin, models.CharField):
             setattr(instance, self.name, 'followers')
 
     def set_activity_from_field(self, activity, instance):
+        try:
+            get_to_cc = _PRIVACY_TO_CC[instance.privacy]
+        except KeyError:
+            return
         mentions = [u.remote_id for u in instance.mention_users.all()]
         # this is a link to the followers list
-        followers = instance.user.__class__._meta.get_field('followers')\
-                .field_to_activity(instance.user.followers)
-        if instance.privacy == 'public':
-            activity['to'] = [self.public]
-            activity['cc'] = [followers] + mentions
-        elif instance.privacy == 'unlisted':
-            activity['to'] = [followers]
-            activity['cc'] = [self.public] + mentions
-        elif instance.privacy == 'followers':
-            activity['to'] = [followers]
-            activity['cc'] = mentions
-        if instance.privacy == 'direct':
-            activity['to'] = mentions
-            activity['cc'] = []
+        followers = instance.user.followers_url
+        activity['to'], activity['cc'] = get_to_cc(followers, mentions)
+
+
+# the to and cc lists for each privacy level, given the followers url and
+# the remote ids of the mentioned users
+_PRIVACY_TO_CC = {
+    'public': lambda followers, mentions: (
+        [PrivacyField.public], [followers] + mentions),
+    'unlisted': lambda followers, mentions: (
+        [followers], [PrivacyField.public] + mentions),
+    'followers': lambda followers, mentions: ([followers], mentions),
+    'direct': lambda followers, mentions: (mentions, []),
+}
 
 
 class ForeignKey(ActivitypubRelatedFieldMixin, models.ForeignKey):
@@ -218,7 +230,7 @@ class ManyToManyField(ActivitypubFieldMixin, models.ManyToManyField):
 
     def set_field_from_activity(self, instance, data):
         ''' helper function for assinging a value to the field '''
-        value = getattr(data, self.get_activitypub_field())
+        value = getattr(data, self.activitypub_name)
         formatted = self.field_from_activity(value)
         if formatted is None or formatted is MISSING:
             return
@@ -230,16 +242,15 @@ class ManyToManyField(ActivitypubFieldMixin, models.ManyToManyField):
         return [i.remote_id for i in value.all()]
 
     def field_from_activity(self, value):
-        items = []
+        remote_ids = []
         for remote_id in value:
             try:
                 validate_remote_id(remote_id)
             except ValidationError:
                 continue
-            items.append(
-                activitypub.resolve_remote_id(self.related_model, remote_id)
-            )
-        return items
+            remote_ids.append(remote_id)
+        return activitypub.resolve_remote_ids_bulk(
+            self.related_model, remote_ids)
 
 
 class TagField(ManyToManyField):
@@ -264,17 +275,16 @@ class TagField(ManyToManyField):
     def field_from_activity(self, value):
         if not isinstance(value, list):
             return None
-        items = []
+        remote_ids = []
         for link_json in value:
             link = activitypub.Link(**link_json)
             tag_type = link.type if link.type != 'Mention' else 'Person'
             if tag_type != self.related_model.activity_serializer.type:
                 # tags can contain multiple types
                 continue
-            items.append(
-                activitypub.resolve_remote_id(self.related_model, link.href)
-            )
-        return items
+            remote_ids.append(link.href)
+        return activitypub.resolve_remote_ids_bulk(
+            self.related_model, remote_ids)
 
 
 def image_serializer(value):
@@ -292,7 +302,7 @@ class ImageField(ActivitypubFieldMixin, models.ImageField):
     # pylint: disable=arguments-differ
     def set_field_from_activity(self, instance, data, save=True):
         ''' helper function for assinging a value to the field '''
-        value = getattr(data, self.get_activitypub_field())
+        value = getattr(data, self.activitypub_name)
         formatted = self.field_from_activity(value)
         if formatted is None or formatted is MISSING:
             return
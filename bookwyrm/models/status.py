@@ -2,11 +2,13 @@
 from django.utils import timezone
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Prefetch
 from model_utils.managers import InheritanceManager
 
 from bookwyrm import activitypub
 from .base_model import ActivitypubMixin, OrderedCollectionPageMixin
 from .base_model import BookWyrmModel
+from .book import Edition
 from . import fields
 from .fields import image_serializer
 
@@ -48,9 +50,9 @@ class Status(OrderedCollectionPageMixin, BookWyrmModel):
     def replies(cls, status):
         ''' load all replies to a status. idk if there's a better way
             to write this so it's just a property '''
-        return cls.objects.filter(
+        return prefetch_activity_fields(cls.objects.filter(
             reply_parent=status
-        ).select_subclasses().order_by('published_date')
+        ).select_subclasses().order_by('published_date'))
 
     @property
     def status_type(self):
@@ -96,11 +98,22 @@ class Status(OrderedCollectionPageMixin, BookWyrmModel):
     def save(self, *args, **kwargs):
         ''' update user active time '''
         if self.user.local:
-            self.user.last_active_date = timezone.now()
-            self.user.save()
+            self.user.touch_active()
         return super().save(*args, **kwargs)
 
 
+def prefetch_activity_fields(queryset):
+    ''' load the related objects that Status.to_activity serializes along
+    with the statuses, instead of querying for them one status at a time '''
+    return queryset.select_related('user').prefetch_related(
+        'mention_users',
+        Prefetch(
+            'mention_books',
+            queryset=Edition.objects.only('id', 'remote_id', 'cover', 'title')
+        ),
+    )
+
+
 class GeneratedNote(Status):
     ''' these are app-generated messages about user activity '''
     @property
@@ -200,8 +213,7 @@ class Favorite(ActivitypubMixin, BookWyrmModel):
 
     def save(self, *args, **kwargs):
         ''' update user active time '''
-        self.user.last_active_date = timezone.now()
-        self.user.save()
+        self.user.touch_active()
         super().save(*args, **kwargs)
 
     class Meta:
@@ -241,8 +253,7 @@ class ReadThrough(BookWyrmModel):
 
     def save(self, *args, **kwargs):
         ''' update user active time '''
-        self.user.last_active_date = timezone.now()
-        self.user.save()
+        self.user.touch_active()
         super().save(*args, **kwargs)
 
 
@@ -1,14 +1,17 @@
 ''' database schema for user data '''
+from datetime import timedelta
 from urllib.parse import urlparse
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.dispatch import receiver
+from django.utils import timezone
 
 from bookwyrm import activitypub
 from bookwyrm.connectors import get_data
 from bookwyrm.models.shelf import Shelf
 from bookwyrm.models.status import Status, Review
+from bookwyrm.models.status import prefetch_activity_fields
 from bookwyrm.settings import DOMAIN
 from bookwyrm.signatures import create_key_pair
 from bookwyrm.tasks import app
@@ -97,14 +100,30 @@ class User(OrderedCollectionPageMixin, AbstractUser):
             return self.name
         return self.localname or self.username
 
+    @property
+    def followers_url(self):
+        ''' the activitypub link to the user's followers collection '''
+        return '%s/followers' % self.remote_id
+
     activity_serializer = activitypub.Person
 
+    def touch_active(self, threshold=timedelta(seconds=60)):
+        ''' update the user's active time, unless it was updated recently.
+        this is a single column update, so it skips save() entirely '''
+        now = timezone.now()
+        updated = User.objects.filter(
+            pk=self.pk,
+            last_active_date__lt=now - threshold
+        ).update(last_active_date=now)
+        if updated:
+            self.last_active_date = now
+
     def to_outbox(self, **kwargs):
         ''' an ordered collection of statuses '''
-        queryset = Status.objects.filter(
+        queryset = prefetch_activity_fields(Status.objects.filter(
             user=self,
             deleted=False,
-        ).select_subclasses().order_by('-published_date')
+        ).select_subclasses().order_by('-published_date'))
         return self.to_ordered_collection(queryset, \
                 remote_id=self.outbox, **kwargs)
 
@@ -116,9 +135,8 @@ class User(OrderedCollectionPageMixin, AbstractUser):
 
     def to_followers_activity(self, **kwargs):
         ''' activitypub followers list '''
-        remote_id = '%s/followers' % self.remote_id
         return self.to_ordered_collection(self.followers.all(), \
-                remote_id=remote_id, id_only=True, **kwargs)
+                remote_id=self.followers_url, id_only=True, **kwargs)
 
     def to_activity(self):
         ''' override default AP serializer to add context object
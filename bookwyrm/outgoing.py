@@ -2,7 +2,7 @@
 import re
 
 from django.db import IntegrityError, transaction
-from django.http import HttpResponseNotFound, JsonResponse
+from django.http import HttpResponseNotFound
 from django.views.decorators.csrf import csrf_exempt
 from requests import HTTPError
 
@@ -11,6 +11,7 @@ from bookwyrm import models
 from bookwyrm.connectors import get_data, ConnectorException
 from bookwyrm.broadcast import broadcast
 from bookwyrm.status import create_notification
+from bookwyrm.status import create_notifications
 from bookwyrm.status import create_generated_note
 from bookwyrm.status import delete_status
 from bookwyrm.settings import DOMAIN
@@ -29,10 +30,7 @@ def outbox(request, username):
         return HttpResponseNotFound()
 
     # collection overview
-    return JsonResponse(
-        user.to_outbox(**request.GET),
-        encoder=activitypub.ActivityEncoder
-    )
+    return activitypub.ActivitypubResponse(user.to_outbox(**request.GET))
 
 
 def handle_remote_webfinger(query):
@@ -217,6 +215,7 @@ def handle_status(user, form):
         regex.username,
         text
     )
+    mention_users = []
     for match in matches:
         username = match.group().strip().split('@')[1:]
         if len(username) == 1:
@@ -228,16 +227,16 @@ def handle_status(user, form):
         if not mention_user:
             # we can ignore users we don't know about
             continue
-        # add them to status mentions fk
-        status.mention_users.add(mention_user)
-        # create notification if the mentioned user is local
-        if mention_user.local:
-            create_notification(
-                mention_user,
-                'MENTION',
-                related_user=user,
-                related_status=status
-            )
+        mention_users.append(mention_user)
+    # add them to status mentions fk
+    status.mention_users.add(*mention_users)
+    # create notifications for the mentioned users that are local
+    create_notifications(
+        [u for u in mention_users if u.local],
+        'MENTION',
+        related_user=user,
+        related_status=status
+    )
     status.save()
 
     # notify reply parent or tagged users
@@ -1,4 +1,5 @@
 ''' Handle user activity '''
+from django.db import transaction
 from django.utils import timezone
 
 from bookwyrm import models
@@ -46,3 +47,27 @@ def create_notification(user, notification_type, related_user=None, \
         related_import=related_import,
         notification_type=notification_type,
     )
+
+
+def create_notifications(users, notification_type, related_user=None, \
+        related_book=None, related_status=None, related_import=None):
+    ''' the same notification for a group of users, saved in bulk '''
+    notifications = [models.Notification(
+        user=user,
+        related_book=related_book,
+        related_user=related_user,
+        related_status=related_status,
+        related_import=related_import,
+        notification_type=notification_type,
+    ) for user in users if user != related_user]
+    if not notifications:
+        return
+
+    with transaction.atomic():
+        models.Notification.objects.bulk_create(
+            notifications, batch_size=500)
+        # bulk_create doesn't send post_save, which sets the remote_id
+        for notification in notifications:
+            notification.remote_id = notification.get_remote_id()
+        models.Notification.objects.bulk_update(
+            notifications, ['remote_id'], batch_size=500)
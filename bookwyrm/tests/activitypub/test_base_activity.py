@@ -11,7 +11,7 @@ import responses
 
 from bookwyrm import activitypub
 from bookwyrm.activitypub.base_activity import ActivityObject, \
-    resolve_remote_id, set_related_field
+    resolve_remote_id, resolve_remote_ids_bulk, set_related_field, to_json
 from bookwyrm.activitypub import ActivitySerializerError
 from bookwyrm import models
 
@@ -66,6 +66,19 @@ class BaseActivity(TestCase):
         self.assertEqual(instance.id, 'a')
         self.assertEqual(instance.type, 'TestObject')
 
+    def test_from_dict(self):
+        ''' build an activity from a json dict '''
+        instance = ActivityObject.from_dict({'id': 'a', 'type': 'b', 'x': 'c'})
+        self.assertIsInstance(instance, ActivityObject)
+        self.assertEqual(instance.id, 'a')
+        self.assertEqual(instance.type, 'b')
+        self.assertFalse(hasattr(instance, 'x'))
+
+    def test_from_dict_missing(self):
+        ''' dict with missing required fields '''
+        with self.assertRaises(ActivitySerializerError):
+            ActivityObject.from_dict({'id': 'a'})
+
     def test_serialize(self):
         ''' simple function for converting dataclass to dict '''
         instance = ActivityObject(id='a', type='b')
@@ -73,6 +86,30 @@ class BaseActivity(TestCase):
         self.assertIsInstance(serialized, dict)
         self.assertEqual(serialized['id'], 'a')
         self.assertEqual(serialized['type'], 'b')
+        self.assertEqual(
+            serialized['@context'], 'https://www.w3.org/ns/activitystreams')
+        self.assertEqual(list(serialized.keys())[0], '@context')
+        # the activity itself isn't changed
+        self.assertFalse('@context' in instance.__dict__)
+
+    def test_slots(self):
+        ''' the small fixed dataclasses don't carry an instance dict '''
+        link = activitypub.Link(href='http://a.b/c', name='c')
+        self.assertFalse(hasattr(link, '__dict__'))
+        self.assertEqual(link.type, 'Link')
+        mention = activitypub.Mention(href='http://a.b/c', name='c')
+        self.assertFalse(hasattr(mention, '__dict__'))
+        self.assertEqual(mention.type, 'Mention')
+        self.assertIsInstance(mention, activitypub.Link)
+
+    def test_to_json(self):
+        ''' encode activities, including nested dataclasses '''
+        signature = activitypub.Signature(
+            creator='a', created='b', signatureValue='c')
+        data = json.loads(to_json({'id': 'a', 'signature': signature}))
+        self.assertEqual(data['id'], 'a')
+        self.assertEqual(data['signature']['creator'], 'a')
+        self.assertEqual(data['signature']['type'], 'RsaSignature2017')
 
     @responses.activate
     def test_resolve_remote_id(self):
@@ -95,6 +132,29 @@ class BaseActivity(TestCase):
         self.assertEqual(result.remote_id, 'https://example.com/user/mouse')
         self.assertEqual(result.name, 'MOUSE?? MOUSE!!')
 
+    @responses.activate
+    def test_resolve_remote_ids_bulk(self):
+        ''' look up known items and load the rest '''
+        responses.add(
+            responses.GET,
+            'https://example.com/user/mouse',
+            json=self.userdata,
+            status=200)
+
+        with patch('bookwyrm.models.user.set_remote_server.delay'):
+            result = resolve_remote_ids_bulk(
+                models.User, [
+                    'http://example.com/a/b',
+                    'https://example.com/user/mouse',
+                    'http://example.com/a/b',
+                ])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0], self.user)
+        self.assertIsInstance(result[1], models.User)
+        self.assertEqual(
+            result[1].remote_id, 'https://example.com/user/mouse')
+        self.assertEqual(len(responses.calls), 1)
+
     def test_to_model_invalid_model(self):
         ''' catch mismatch between activity type and model type '''
         instance = ActivityObject(id='a', type='b')
@@ -232,10 +292,51 @@ class BaseActivity(TestCase):
             status=200)
 
         # sets the celery task call to the function call
-        with patch(
-                'bookwyrm.activitypub.base_activity.set_related_field.delay'):
+        with patch('bookwyrm.activitypub.base_activity.group') as group_mock:
             update_data.to_model(models.Status, instance=status)
         self.assertIsNone(status.attachments.first())
+        # one group is queued with a task for each attachment
+        self.assertEqual(group_mock.call_count, 1)
+        self.assertEqual(len(group_mock.call_args[0][0]), 1)
+        group_mock.return_value.apply_async.assert_called_once()
+
+
+    def test_to_model_one_to_many_subclass(self):
+        ''' the related field is named for the field, not the model '''
+        book = models.Edition.objects.create(title='Test Edition')
+        comment = models.Comment.objects.create(
+            content='test comment',
+            user=self.user,
+            book=book,
+        )
+        update_data = activitypub.Comment(**comment.to_activity())
+        data = {
+            'url': 'http://www.example.com/image.jpg',
+            'name': 'alt text',
+            'type': 'Image',
+        }
+        update_data.attachment = [data]
+
+        with patch('bookwyrm.activitypub.base_activity.group') as group_mock:
+            update_data.to_model(models.Comment, instance=comment)
+        task = group_mock.call_args[0][0][0]
+        self.assertEqual(
+            task.args,
+            ('Image', 'Comment', 'status', comment.remote_id, data))
+
+
+    def test_to_model_one_to_many_known(self):
+        ''' items we already have are linked without a task '''
+        work = models.Work.objects.create(title='Test Work')
+        edition = models.Edition.objects.create(title='Test Edition')
+        update_data = activitypub.Work(**work.to_activity())
+        update_data.editions = [edition.remote_id]
+
+        with patch('bookwyrm.activitypub.base_activity.group') as group_mock:
+            update_data.to_model(models.Work, instance=work)
+        group_mock.assert_not_called()
+        edition.refresh_from_db()
+        self.assertEqual(edition.parent_work, work)
 
 
     @responses.activate
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+from django.test import TestCase
+
+from bookwyrm import models, incoming
+
+
+class IncomingCreate(TestCase):
+    def setUp(self):
+        with patch('bookwyrm.models.user.set_remote_server.delay'):
+            with patch('bookwyrm.models.user.get_remote_reviews.delay'):
+                self.remote_user = models.User.objects.create_user(
+                    'rat', 'rat@rat.com', 'ratword',
+                    local=False,
+                    remote_id='https://example.com/users/rat',
+                    inbox='https://example.com/users/rat/inbox',
+                    outbox='https://example.com/users/rat/outbox',
+                )
+        self.local_user = models.User.objects.create_user(
+            'mouse', 'mouse@mouse.com', 'mouseword', local=True,
+            remote_id='http://local.com/user/mouse')
+
+        self.status = models.Status.objects.create(
+            user=self.local_user,
+            content='Test status',
+            remote_id='http://local.com/status/1',
+        )
+
+
+    def test_handle_create_reply(self):
+        activity = {
+            '@context': 'https://www.w3.org/ns/activitystreams',
+            'id': 'https://example.com/users/rat/statuses/1/activity',
+            'type': 'Create',
+            'actor': 'https://example.com/users/rat',
+            'object': {
+                'id': 'https://example.com/users/rat/statuses/1',
+                'type': 'Note',
+                'attributedTo': 'https://example.com/users/rat',
+                'published': '2020-12-04T17:52:22.623807+00:00',
+                'content': '@mouse hi',
+                'inReplyTo': 'http://local.com/status/1',
+                'to': ['https://www.w3.org/ns/activitystreams#Public'],
+                'cc': ['http://local.com/user/mouse'],
+                # replies from other servers tag the author they reply to
+                'tag': [{
+                    'type': 'Mention',
+                    'name': '@mouse',
+                    'href': 'http://local.com/user/mouse',
+                }],
+            },
+        }
+
+        incoming.handle_create(activity)
+
+        status = models.Status.objects.get(
+            remote_id='https://example.com/users/rat/statuses/1')
+        self.assertEqual(status.reply_parent, self.status)
+        self.assertEqual(status.mention_users.get(), self.local_user)
+
+        # the reply is only notified once
+        notification = models.Notification.objects.get()
+        self.assertEqual(notification.user, self.local_user)
+        self.assertEqual(notification.notification_type, 'REPLY')
+        self.assertEqual(notification.related_status, status)
@@ -5,32 +5,34 @@ from django.test import TestCase
 
 from bookwyrm import models, incoming
 
+_USER_DATA = json.loads(pathlib.Path(__file__).parent.joinpath(
+    '../data/ap_user.json'
+).read_bytes())
+
 
 class Favorite(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         with patch('bookwyrm.models.user.set_remote_server.delay'):
             with patch('bookwyrm.models.user.get_remote_reviews.delay'):
-                self.remote_user = models.User.objects.create_user(
+                cls.remote_user = models.User.objects.create_user(
                     'rat', 'rat@rat.com', 'ratword',
                     local=False,
                     remote_id='https://example.com/users/rat',
                     inbox='https://example.com/users/rat/inbox',
                     outbox='https://example.com/users/rat/outbox',
                 )
-        self.local_user = models.User.objects.create_user(
+        cls.local_user = models.User.objects.create_user(
             'mouse', 'mouse@mouse.com', 'mouseword', local=True,
             remote_id='http://local.com/user/mouse')
 
-        self.status = models.Status.objects.create(
-            user=self.local_user,
+        cls.status = models.Status.objects.create(
+            user=cls.local_user,
             content='Test status',
             remote_id='http://local.com/status/1',
         )
 
-        datafile = pathlib.Path(__file__).parent.joinpath(
-            '../data/ap_user.json'
-        )
-        self.user_data = json.loads(datafile.read_bytes())
+        cls.user_data = _USER_DATA
 
 
 
@@ -166,6 +166,32 @@ class BaseModel(TestCase):
         self.assertEqual(activity['type'], 'Test')
 
 
+    def test_get_activitypub_fields(self):
+        ''' sort model fields by how they're deserialized '''
+        plan = base_model.get_activitypub_fields(models.User)
+        image_fields, many_to_many_fields, simple_fields = plan
+        self.assertEqual([f.name for f in image_fields], ['avatar'])
+        self.assertEqual(
+            [f.name for f in many_to_many_fields], ['followers'])
+        self.assertTrue('name' in [f.name for f in simple_fields])
+        self.assertFalse('local' in [f.name for f in simple_fields])
+
+        # the same field lists are shared by every instance
+        user = models.User()
+        self.assertIs(user.image_fields, image_fields)
+        self.assertIs(base_model.get_activitypub_fields(models.User), plan)
+
+
+    def test_get_deduplication_fields(self):
+        ''' fields used to match activities to existing objects '''
+        dedup_fields = base_model.get_deduplication_fields(models.User)
+        self.assertEqual(
+            sorted(f.name for f in dedup_fields),
+            ['inbox', 'outbox', 'remote_id'])
+        self.assertIs(
+            base_model.get_deduplication_fields(models.User), dedup_fields)
+
+
     def test_find_existing_by_remote_id(self):
         ''' attempt to match a remote id to an object in the db '''
         # uses a different remote id scheme
@@ -200,3 +226,21 @@ class BaseModel(TestCase):
         # test subclass match
         result = models.Status.find_existing_by_remote_id(
             'https://comment.net')
+
+
+    def test_find_existing_by_remote_ids(self):
+        ''' match a list of remote ids with one query '''
+        user = models.User.objects.create_user(
+            'mouse', 'mouse@mouse.mouse', 'mouseword', local=True)
+        comment = models.Comment.objects.create(
+            user=user, content='test status', remote_id='https://comment.net',
+            book=models.Edition.objects.create(title='Test Edition'))
+
+        self.assertEqual(models.Status.find_existing_by_remote_ids([]), {})
+
+        result = models.Status.find_existing_by_remote_ids(
+            ['https://comment.net', 'https://nothing.net'])
+        self.assertEqual(list(result.keys()), ['https://comment.net'])
+        # uses subclasses
+        self.assertIsInstance(result['https://comment.net'], models.Comment)
+        self.assertEqual(result['https://comment.net'], comment)
@@ -71,6 +71,19 @@ class ActivitypubFields(TestCase):
         instance.name = 'snake_case_name'
         self.assertEqual(instance.get_activitypub_field(), 'snakeCaseName')
 
+    def test_activitypub_name(self):
+        ''' the activitypub name is set when the field is added to a model '''
+        self.assertEqual(
+            User._meta.get_field('manually_approves_followers')\
+                    .activitypub_name,
+            'manuallyApprovesFollowers')
+        self.assertEqual(
+            User._meta.get_field('shared_inbox').activitypub_name,
+            'endpoints')
+        self.assertEqual(
+            Status._meta.get_field('reply_parent').activitypub_name,
+            'inReplyTo')
+
     def test_remote_id_field(self):
         ''' just sets some defaults on charfield '''
         instance = fields.RemoteIdField()
@@ -1,6 +1,10 @@
 ''' testing models '''
+from datetime import timedelta
 from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from bookwyrm import models
 from bookwyrm.settings import DOMAIN
@@ -31,6 +35,15 @@ class User(TestCase):
         self.assertEqual(user.username, 'rat@example.com')
 
 
+    def test_followers_url(self):
+        ''' link to the followers collection '''
+        self.assertEqual(
+            self.user.followers_url, '%s/followers' % self.user.remote_id)
+        self.assertEqual(
+            self.user.followers_url,
+            models.User.followers.field.field_to_activity(self.user.followers))
+
+
     def test_user_shelves(self):
         shelves = models.Shelf.objects.filter(user=self.user).all()
         self.assertEqual(len(shelves), 3)
@@ -70,3 +83,46 @@ class User(TestCase):
         self.assertEqual(activity['type'], 'OrderedCollection')
         self.assertEqual(activity['id'], self.user.outbox)
         self.assertEqual(activity['totalItems'], 0)
+
+    def test_activitypub_outbox_queries(self):
+        ''' the statuses' user and mentions are loaded for the whole page,
+        not status by status '''
+        rat = models.User.objects.create_user(
+            'rat', 'rat@rat.rat', 'ratword', local=True)
+        book = models.Edition.objects.create(title='Example Edition')
+
+        def create_status():
+            status = models.Status.objects.create(
+                user=self.user, content='hi @rat')
+            status.mention_users.add(rat, self.user)
+            status.mention_books.add(book)
+
+        create_status()
+        with CaptureQueriesContext(connection) as one_status:
+            self.user.to_outbox(page=1)
+
+        create_status()
+        create_status()
+        # each status still counts its replies and loads its attachments
+        with self.assertNumQueries(len(one_status) + 2 * 2):
+            activity = self.user.to_outbox(page=1)
+        self.assertEqual(len(activity['orderedItems']), 3)
+        for item in activity['orderedItems']:
+            self.assertEqual(len(item['tag']), 3)
+
+
+    def test_touch_active(self):
+        ''' active time is only updated when it's out of date '''
+        long_ago = timezone.now() - timedelta(days=1)
+        models.User.objects.filter(pk=self.user.pk).update(
+            last_active_date=long_ago)
+
+        self.user.touch_active()
+        self.user.refresh_from_db()
+        self.assertGreater(self.user.last_active_date, long_ago)
+
+        # a second update right away doesn't change anything
+        last_active = self.user.last_active_date
+        self.user.touch_active()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_active_date, last_active)
@@ -0,0 +1,42 @@
+from unittest.mock import patch
+from django.test import TestCase
+
+from bookwyrm import forms, models, outgoing
+
+
+class Status(TestCase):
+    def setUp(self):
+        self.user = models.User.objects.create_user(
+            'mouse', 'mouse@mouse.com', 'mouseword', local=True)
+        self.book = models.Edition.objects.create(title='Example Edition')
+
+
+    def test_handle_status_mentions(self):
+        rat = models.User.objects.create_user(
+            'rat', 'rat@rat.com', 'ratword', local=True)
+        nutria = models.User.objects.create_user(
+            'nutria', 'nutria@nutria.com', 'nutriaword', local=True)
+        form = forms.CommentForm({
+            'user': self.user.id,
+            'book': self.book.id,
+            'content': 'hi @rat and @nutria and @mouse',
+            'privacy': 'public',
+        })
+        self.assertTrue(form.is_valid())
+
+        with patch('bookwyrm.broadcast.broadcast_task.delay'):
+            outgoing.handle_status(self.user, form)
+
+        status = models.Comment.objects.get()
+        self.assertEqual(
+            set(status.mention_users.all()), {rat, nutria, self.user})
+
+        # everyone mentioned but the author is notified
+        notifications = models.Notification.objects.all()
+        self.assertEqual(
+            {n.user for n in notifications}, {rat, nutria})
+        for notification in notifications:
+            self.assertEqual(notification.notification_type, 'MENTION')
+            self.assertEqual(notification.related_user, self.user)
+            self.assertEqual(notification.related_status.id, status.id)
+            self.assertIsNotNone(notification.remote_id)
@@ -1,5 +1,9 @@
+from base64 import b64encode
+import hashlib
+import json
 from unittest.mock import patch
 from django.test import TestCase
+import responses
 
 from bookwyrm import models, broadcast
 
@@ -76,3 +80,22 @@ class Book(TestCase):
 
         recipients = broadcast.get_public_recipients(self.user, software='mastodon')
         self.assertEqual(recipients, expected)
+
+
+    @responses.activate
+    def test_sign_and_send_unicode(self):
+        activity = {'content': 'caf\u00e9 \u2019 \U0001f42d \u66f8'}
+        with patch('bookwyrm.broadcast.broadcast_task.delay') as task:
+            broadcast.broadcast(self.user, activity, privacy='direct')
+        data = task.call_args[0][1]
+
+        responses.add(responses.POST, 'http://example.com/inbox')
+        broadcast.sign_and_send(self.user, data, 'http://example.com/inbox')
+
+        # the body is sent as utf-8 and matches its digest
+        request = responses.calls[0].request
+        self.assertEqual(json.loads(request.body.decode('utf-8')), activity)
+        self.assertEqual(
+            request.headers['Digest'],
+            'SHA-256=' + b64encode(
+                hashlib.sha256(request.body).digest()).decode('utf-8'))
@@ -0,0 +1,44 @@
+from django.test import TestCase
+
+from bookwyrm import models, status as status_builder
+
+
+class Status(TestCase):
+    def setUp(self):
+        self.user = models.User.objects.create_user(
+            'mouse', 'mouse@mouse.mouse', 'mouseword', local=True)
+        self.status = models.Status.objects.create(
+            user=self.user, content='Test status')
+
+
+    def test_create_notifications(self):
+        rat = models.User.objects.create_user(
+            'rat', 'rat@rat.rat', 'ratword', local=True)
+        nutria = models.User.objects.create_user(
+            'nutria', 'nutria@nutria.nutria', 'nutriaword', local=True)
+
+        status_builder.create_notifications(
+            [rat, nutria, self.user],
+            'MENTION',
+            related_user=self.user,
+            related_status=self.status,
+        )
+
+        # no notification for the user who caused it
+        notifications = models.Notification.objects.order_by('id')
+        self.assertEqual(
+            [n.user for n in notifications], [rat, nutria])
+        for notification in notifications:
+            self.assertEqual(notification.notification_type, 'MENTION')
+            self.assertEqual(notification.related_user, self.user)
+            self.assertEqual(notification.related_status, self.status)
+            # the same remote_id a single create gets from post_save
+            self.assertEqual(
+                notification.remote_id, notification.get_remote_id())
+
+
+    def test_create_notifications_empty(self):
+        with self.assertNumQueries(0):
+            status_builder.create_notifications(
+                [self.user], 'MENTION', related_user=self.user)
+        self.assertFalse(models.Notification.objects.exists())
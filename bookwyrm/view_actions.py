@@ -37,6 +37,7 @@ def user_login(request):
         # successful login
         login(request, user)
         user.last_active_date = timezone.now()
+        user.save(update_fields=['last_active_date'])
         return redirect(request.GET.get('next', '/'))
 
     login_form.non_field_errors = 'Username or password are incorrect'